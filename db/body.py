@@ -0,0 +1,74 @@
+"""Read access to Body.data, the sequential zlib blocks of the macOS dictionary bundle."""
+
+import mmap
+import re
+import struct
+import zlib
+from pathlib import Path
+
+CONTENTS = Path("oxford.dictionary/Contents").resolve()
+BODY = CONTENTS / "Body.data"
+
+_RE_TITLE = re.compile(rb'd:title="([^"]+)"')
+
+# Leading (sz1, sz2) of each block's 12-byte header, format parsed once
+_BLOCK_SIZES = struct.Struct("<II")
+
+# Compressed bytes fed per step while looking for an entry's title
+_TITLE_CHUNK = 512
+
+
+def map_body() -> mmap.mmap:
+    """Memory-map Body.data read-only; pages are faulted in only as they are touched."""
+    with open(BODY, "rb") as f:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def inflate_entry_at(data: bytes, pos: int) -> bytes:
+    """Raw decompressed bytes of the block at pos."""
+    _sz1, sz2 = _BLOCK_SIZES.unpack_from(data, pos)
+    zlib_start = pos + 12
+    compressed_size = sz2 - 4
+    # Inflate straight from the mapping instead of copying the compressed block out first
+    with memoryview(data) as view:
+        return zlib.decompress(view[zlib_start:zlib_start + compressed_size])
+
+
+def read_entry_at(data: bytes, pos: int) -> str:
+    return inflate_entry_at(data, pos).decode("utf-8", errors="replace")
+
+
+def _find_title(data: bytes, start: int, end: int) -> re.Match | None:
+    """Inflate the zlib stream in data[start:end] only until d:title="..." appears.
+
+    The title sits in the opening <d:entry> tag, so this usually stops after
+    the first chunk instead of inflating the whole entry."""
+    d = zlib.decompressobj()
+    out = bytearray()
+    for chunk_start in range(start, end, _TITLE_CHUNK):
+        out += d.decompress(data[chunk_start:min(chunk_start + _TITLE_CHUNK, end)])
+        m = _RE_TITLE.search(out)
+        if m or d.eof:
+            return m
+    return None
+
+
+def build_index(data: bytes) -> dict[str, int]:
+    """Build word -> byte offset index from Body.data."""
+    index: dict[str, int] = {}
+    pos = 0x60
+    while pos < len(data) - 12:
+        sz1, sz2 = _BLOCK_SIZES.unpack_from(data, pos)
+        if sz1 == 0 or sz1 > 500_000:
+            break
+        zlib_start = pos + 12
+        compressed_size = sz2 - 4
+        try:
+            m = _find_title(data, zlib_start, zlib_start + compressed_size)
+            if m:
+                title = m.group(1).decode("utf-8", errors="replace")
+                index[title.lower()] = pos
+        except Exception:
+            pass
+        pos = zlib_start + compressed_size
+    return index
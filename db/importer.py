@@ -1,14 +1,17 @@
 """Import pipeline: read Body.data -> parse -> insert into SQLite."""
 
+import mmap
 import re
 import sqlite3
-import struct
 import sys
-import zlib
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
 from pathlib import Path
 
 import opencc
 
+from .body import build_index, map_body, read_entry_at
 from .models import EntryData
 from .parser import parse_entry
 from .schema import create_schema
@@ -20,51 +23,62 @@ def s2t(text: str) -> str:
     """Convert Simplified Chinese to Traditional Chinese."""
     return _converter.convert(text) if text else ""
 
-CONTENTS = Path("oxford.dictionary/Contents").resolve()
-BODY = CONTENTS / "Body.data"
-
-
-def _read_entry_at(data: bytes, pos: int) -> str:
-    sz2 = struct.unpack_from("<I", data, pos + 4)[0]
-    zlib_start = pos + 12
-    compressed_size = sz2 - 4
-    return zlib.decompress(data[zlib_start:zlib_start + compressed_size]).decode("utf-8", errors="replace")
-
-
-def _build_index(data: bytes) -> dict[str, int]:
-    """Build word -> byte offset index from Body.data."""
-    index: dict[str, int] = {}
-    pos = 0x60
-    while pos < len(data) - 12:
-        sz1 = struct.unpack_from("<I", data, pos)[0]
-        sz2 = struct.unpack_from("<I", data, pos + 4)[0]
-        if sz1 == 0 or sz1 > 500_000:
-            break
-        zlib_start = pos + 12
-        compressed_size = sz2 - 4
-        try:
-            partial = zlib.decompress(data[zlib_start:zlib_start + compressed_size], 15, 512)
-            m = re.search(rb'd:title="([^"]+)"', partial)
-            if m:
-                title = m.group(1).decode("utf-8", errors="replace")
-                index[title.lower()] = pos
-        except Exception:
-            pass
-        pos = zlib_start + compressed_size
-    return index
-
-
-def _build_variants(data: bytes, index: dict[str, int]) -> dict[str, str]:
-    """Build variant spelling -> headword map."""
+_RE_VARIANT = re.compile(r'<span class="v"[^>]*>([^<]+)</span>')
+
+
+# Per-process Body.data mapping, set up by the pool initializer
+_worker_body: mmap.mmap | None = None
+
+
+def _init_worker() -> None:
+    global _worker_body
+    _worker_body = map_body()
+
+
+def _parse_at(pos: int) -> tuple[list[EntryData], list[str], str | None]:
+    """Pool worker: decompress the entry at pos once, then parse it and
+    collect its variant spellings from the same HTML.
+
+    Errors are returned rather than raised so one bad entry does not abort
+    the ordered result stream."""
+    try:
+        html = read_entry_at(_worker_body, pos)
+    except Exception as e:
+        return [], [], str(e)
+
+    variants = [v for m in _RE_VARIANT.finditer(html) if (v := m.group(1).strip().lower())]
+    try:
+        return [entry for entry, _raw_html in parse_entry(html)], variants, None
+    except Exception as e:
+        return [], variants, str(e)
+
+
+def _map_batched(
+    pool: ProcessPoolExecutor, fn: Callable, items: Iterable, batch_size: int,
+) -> Iterator:
+    """Ordered pool.map over items that keeps at most two batches in flight.
+
+    Executor.map submits every item up front, so results pile up in memory
+    whenever the consumer is slower than the workers. Submitting the next
+    batch just before draining the current one keeps workers busy while
+    bounding buffered results."""
+    it = iter(items)
+    pending = pool.map(fn, list(islice(it, batch_size)), chunksize=64)
+    while True:
+        batch = list(islice(it, batch_size))
+        ahead = pool.map(fn, batch, chunksize=64) if batch else None
+        yield from pending
+        if ahead is None:
+            return
+        pending = ahead
+
+
+def _build_variants(index: dict[str, int], found: dict[str, list[str]]) -> dict[str, str]:
+    """Build variant spelling -> headword map from the variants found per headword."""
     variants: dict[str, str] = {}
-    for headword, pos in index.items():
-        try:
-            html = _read_entry_at(data, pos)
-        except Exception:
-            continue
-        for m in re.finditer(r'<span class="v"[^>]*>([^<]+)</span>', html):
-            variant = m.group(1).strip().lower()
-            if variant and variant not in index:
+    for headword in index:
+        for variant in found.get(headword, ()):
+            if variant not in index:
                 variants[variant] = headword
     return variants
 
@@ -224,13 +238,14 @@ def import_all(db_path: str | Path, verbose: bool = False) -> None:
     )
     source_id = cur.lastrowid
 
-    # Load binary data
-    print("Loading Body.data...", file=sys.stderr)
-    body_data = BODY.read_bytes()
+    # Map binary data
+    print("Mapping Body.data...", file=sys.stderr)
+    body_data = map_body()
 
     # Build index
     print("Building word index...", file=sys.stderr)
-    index = _build_index(body_data)
+    index = build_index(body_data)
+    body_data.close()
     print(f"  {len(index)} headwords found", file=sys.stderr)
 
     # Parse and insert all entries
@@ -239,45 +254,51 @@ def import_all(db_path: str | Path, verbose: bool = False) -> None:
     total_senses = 0
     total_examples = 0
     failed = []
+    found_variants: dict[str, list[str]] = {}
 
-    headwords = sorted(index.keys())
+    headwords = sorted(index)
     batch_size = 1000
 
-    for i, headword in enumerate(headwords):
-        if i % batch_size == 0 and i > 0:
-            db.commit()
-            print(f"  {i}/{len(headwords)} headwords processed...", file=sys.stderr)
-
-        try:
-            html = _read_entry_at(body_data, index[headword])
-            entries = parse_entry(html)
-
-            parent_id = None
-            for entry_index, (entry, _raw_html) in enumerate(entries):
-                if entry.card_type == 'idiom':
-                    _insert_entry(db, source_id, entry, entry_index, parent_entry_id=parent_id)
-                else:
-                    parent_id = _insert_entry(db, source_id, entry, entry_index)
-                total_entries += 1
-                for g in entry.groups:
-                    total_senses += len(g.senses)
-                    for s in g.senses:
-                        total_examples += len(s.examples)
-
-            if verbose and entries:
-                pos_list = ", ".join(e.pos for e, _ in entries if e.pos)
+    # Decompress + parse in worker processes; inserts stay serial in this one
+    with ProcessPoolExecutor(initializer=_init_worker) as pool:
+        results = _map_batched(pool, _parse_at, (index[h] for h in headwords), batch_size)
+        for i, (headword, (entries, variants, error)) in enumerate(zip(headwords, results)):
+            if i % batch_size == 0 and i > 0:
+                db.commit()
+                print(f"  {i}/{len(headwords)} headwords processed...", file=sys.stderr)
+
+            if variants:
+                found_variants[headword] = variants
+
+            if error is None:
+                try:
+                    parent_id = None
+                    for entry_index, entry in enumerate(entries):
+                        if entry.card_type == 'idiom':
+                            _insert_entry(db, source_id, entry, entry_index, parent_entry_id=parent_id)
+                        else:
+                            parent_id = _insert_entry(db, source_id, entry, entry_index)
+                        total_entries += 1
+                        for g in entry.groups:
+                            total_senses += len(g.senses)
+                            for s in g.senses:
+                                total_examples += len(s.examples)
+                except Exception as e:
+                    error = str(e)
+
+            if error is not None:
+                failed.append((headword, error))
+                if verbose:
+                    print(f"    FAILED: {headword}: {error}", file=sys.stderr)
+            elif verbose and entries:
+                pos_list = ", ".join(e.pos for e in entries if e.pos)
                 print(f"    {headword} ({pos_list}): {len(entries)} entries", file=sys.stderr)
 
-        except Exception as e:
-            failed.append((headword, str(e)))
-            if verbose:
-                print(f"    FAILED: {headword}: {e}", file=sys.stderr)
-
     db.commit()
 
     # Build variants
     print("Building variant index...", file=sys.stderr)
-    variants = _build_variants(body_data, index)
+    variants = _build_variants(index, found_variants)
     print(f"  {len(variants)} variants found", file=sys.stderr)
 
     # Map variant -> entry_id(s) for the target headword
@@ -18,9 +18,95 @@ from .models import (
     WordFamilyData, XrefData,
 )
 
+_RE_STRIP = re.compile(r"<[^>]+>|\s+")
+_RE_SPAN_TAG = re.compile(r"<span|</span>")
+_RE_TITLE = re.compile(r'd:title="([^"]+)"')
+_ENTRY_OPEN = '<div class="entry"'
+_RE_AUDIO = re.compile(r'new Audio\("([^"]+)"\)')
+_RE_CHN = re.compile(r'<chn>(.*?)</chn>', re.DOTALL)
+_RE_CEFR = re.compile(r'cefr="(\w+)"')
+_RE_XH = re.compile(r'<span class="xh"[^>]*>([^<]+)</span>')
+_RE_LI_WORD = re.compile(r'<li class="li"[^>]*>([^<]+)</li>')
+_RE_P = re.compile(r'<span class="p"[^>]*>(.*?)</span>', re.DOTALL)
+
+# Senses
+_RE_SENSE_BLOCK = re.compile(r'<li\s[^>]*class="sense".*?(?=<li\s[^>]*class="sense"|\Z)', re.DOTALL)
+_RE_SENSENUM = re.compile(r'sensenum="(\d+)"')
+_RE_GRAMMAR = re.compile(r'<span class="grammar"[^>]*>(.*?)</span>', re.DOTALL)
+_RE_LABELS = re.compile(r'<span class="labels"[^>]*>(.*?)</span>', re.DOTALL)
+_RE_VARIANTS = re.compile(r'<div class="variants"[^>]*>(.*?)</div>', re.DOTALL)
+_RE_DEF_ZH = re.compile(r'<deft>.*?<chn>(.*?)</chn>.*?</deft>', re.DOTALL)
+
+# Verb forms
+_RE_VERB_FORM_ROW = re.compile(r'<tr\b[^>]*\bform="([^"]+)"[^>]*>(.*?)</tr>', re.DOTALL)
+_RE_VERB_FORM_TD = re.compile(r'<td\b[^>]*\bclass="verb_form"[^>]*>(.*?)</td>', re.DOTALL)
+_RE_VERB_FORM_AUDIO_GB = re.compile(r'class="phons_br".*?new Audio\("([^"]+)"\)', re.DOTALL)
+_RE_VERB_FORM_AUDIO_US = re.compile(r'class="phons_n_am".*?new Audio\("([^"]+)"\)', re.DOTALL)
+
+# Unbox sections (synonyms, word origin, word family, collocations, extra examples)
+_RE_UNBOX_TYPED = re.compile(r'<span class="unbox"[^>]*unbox="([^"]+)"[^>]*>')
+_UNBOX_TYPES = frozenset({"synonyms", "wordorigin", "wordfamily", "snippet", "extra_examples"})
+_RE_SYN_TITLE = re.compile(r'<span class="closed">([^<]+)</span>')
+_RE_SYN_INLINE = re.compile(r'<ul class="inline"[^>]*>(.*?)</ul>', re.DOTALL)
+_RE_SYN_DEF = re.compile(
+    r'<li class="li"[^>]*>\s*<span class="dt">(.*?)</span>\s*<span class="dd">(.*?)</span>', re.DOTALL,
+)
+_RE_ORIGIN_BODY = re.compile(r'<span class="body"[^>]*>(.*)', re.DOTALL)
+_RE_FAMILY_ITEM = re.compile(r'<span class="p"[^>]*>(.*?)</span>\s*</li>', re.DOTALL)
+_RE_FAMILY_WORD = re.compile(r'<span class="wfw"[^>]*>([^<]+)</span>')
+_RE_FAMILY_POS = re.compile(r'<span class="wfp"[^>]*>([^<]+)</span>')
+_RE_FAMILY_OPP = re.compile(r'<span class="wfo"[^>]*>([^<]+)</span>')
+_RE_UNBOX_OPEN = re.compile(r'<span class="unbox"[^>]*>')
+_RE_COLLOC_CATEGORY = re.compile(r'([^<]+)<')
+_RE_EXTRA_ITEM = re.compile(r'<li[^>]*>(.*?)</li>', re.DOTALL)
+_RE_EXTRA_TEXT = re.compile(r'<span class="unx"[^>]*>(.*?)</span>', re.DOTALL)
+
+# Cross-references
+_RE_XREFS_OPEN = re.compile(r'<span class="xrefs"[^>]*>')
+_RE_XREF_TYPE = re.compile(r'xt="(\w+)"')
+_RE_PHRASAL_VERBS = re.compile(r'<aside class="phrasal_verb_links"[^>]*>(.*?)</aside>', re.DOTALL)
+
+# PoS block header
+# Headword <h1> tag and, when it is plain text, its content in the same match
+_RE_HEADWORD = re.compile(r'(<h1\s[^>]*class="headword"[^>]*>)(?:([^<]+)</h1>)?')
+_RE_HEADWORD_TEXT = re.compile(r'<h1\s[^>]*class="headword"[^>]*>([^<]+)</h1>')
+_RE_POS = re.compile(r'<span class="pos"[^>]*>([^<]+)</span>')
+_RE_PHON_GB = re.compile(r'class="phons_br"[^>]*>.*?<span class="phon">([^<]+)</span>', re.DOTALL)
+_RE_PHON_US = re.compile(r'class="phons_n_am"[^>]*>.*?<span class="phon">([^<]+)</span>', re.DOTALL)
+_RE_SYMBOLS = re.compile(r'<div class="symbols"[^>]*>.*?</div>', re.DOTALL)
+_RE_DATA_CEFR = re.compile(r'data-cefr="(\w+)"')
+# Literal section markers, alternated so one scan finds whichever comes first
+_RE_SENSE_START = re.compile(r'<ol class="sense|<li class="sense')
+_RE_SECTION_START = re.compile(r'<span class="shcut-g"|<span class="idm-g"')
+_RE_AUDIO_GB = re.compile(r"[^_].*_gb_")
+_RE_AUDIO_US = re.compile(r"[^_].*_us_")
+_RE_SHCUT_GROUP = re.compile(
+    r'<span class="shcut-g".*?(?=<span class="shcut-g"|<span class="idm-g"|$)', re.DOTALL,
+)
+_RE_SHCUT_TITLE = re.compile(r'<h2 class="shcut"[^>]*>(.*?)</h2>', re.DOTALL)
+_RE_SHCUTT = re.compile(r'<shcutt>.*?</shcutt>', re.DOTALL)
+_RE_IDIOM_GROUP = re.compile(r'<span class="idm-g".*?(?=<span class="idm-g"|$)', re.DOTALL)
+_RE_IDIOM = re.compile(r'<span class="idm"[^>]*>(.*?)</span>')
+
 
 def strip_tags(html: str) -> str:
-    return re.sub(r"\s+", " ", re.sub(r"<[^>]+>", " ", html)).strip()
+    # Tags and whitespace runs are both separators; one split, no intermediate string
+    return " ".join(filter(None, _RE_STRIP.split(html)))
+
+
+def _span_close(html: str, pos: int) -> int:
+    """Index of the </span> closing a span whose content starts at pos, or -1.
+
+    Walks the open/close tags in a single left-to-right regex pass."""
+    depth = 1
+    for m in _RE_SPAN_TAG.finditer(html, pos):
+        if m.group() == "<span":
+            depth += 1
+        else:
+            depth -= 1
+            if depth == 0:
+                return m.start()
+    return -1
 
 
 def extract_span(html: str, class_name: str) -> str | None:
@@ -32,21 +118,8 @@ def extract_span(html: str, class_name: str) -> str | None:
         return None
     tag_start = html.rfind("<", 0, idx)
     content_start = html.find(">", tag_start) + 1
-    depth, pos = 1, content_start
-    while pos < len(html) and depth > 0:
-        open_next = html.find("<span", pos)
-        close_next = html.find("</span>", pos)
-        if close_next == -1:
-            break
-        if open_next != -1 and open_next < close_next:
-            depth += 1
-            pos = open_next + 5
-        else:
-            depth -= 1
-            if depth == 0:
-                return html[content_start:close_next]
-            pos = close_next + 7
-    return None
+    close = _span_close(html, content_start)
+    return html[content_start:close] if close != -1 else None
 
 
 def _find_examples(block: str) -> list[tuple[str, str]]:
@@ -84,27 +157,40 @@ def _find_examples(block: str) -> list[tuple[str, str]]:
     return results
 
 
+def _iter_sense_blocks(html: str):
+    """Yield html split before each <li ... class="sense">, one chunk at a time."""
+    matches = _RE_SENSE_BLOCK.finditer(html)
+    first = next(matches, None)
+    if first is None:
+        yield html
+        return
+    yield html[:first.start()]
+    yield first.group()
+    for m in matches:
+        yield m.group()
+
+
 def _parse_senses(html: str) -> list[SenseData]:
     """Extract a flat list of senses from any HTML fragment."""
     senses = []
-    for block in re.split(r'(?=<li\s[^>]*class="sense")', html):
+    for block in _iter_sense_blocks(html):
         if 'class="sense"' not in block:
             continue
 
-        m = re.search(r'sensenum="(\d+)"', block)
+        m = _RE_SENSENUM.search(block)
         sense_num = int(m.group(1)) if m else None
 
         # Sense-level CEFR
-        m = re.search(r'cefr="(\w+)"', block)
+        m = _RE_CEFR.search(block)
         cefr_level = m.group(1) if m else ""
 
-        m = re.search(r'<span class="grammar"[^>]*>(.*?)</span>', block, re.DOTALL)
+        m = _RE_GRAMMAR.search(block)
         grammar = strip_tags(m.group(1)) if m else ""
 
-        labels = re.findall(r'<span class="labels"[^>]*>(.*?)</span>', block, re.DOTALL)
+        labels = _RE_LABELS.findall(block)
         labels_text = " ".join(strip_tags(l) for l in labels)
 
-        m = re.search(r'<div class="variants"[^>]*>(.*?)</div>', block, re.DOTALL)
+        m = _RE_VARIANTS.search(block)
         variants = strip_tags(m.group(1)) if m else ""
 
         def_inner = extract_span(block, "def")
@@ -112,7 +198,7 @@ def _parse_senses(html: str) -> list[SenseData]:
         if not definition:
             continue
 
-        m = re.search(r'<deft>.*?<chn>(.*?)</chn>.*?</deft>', block, re.DOTALL)
+        m = _RE_DEF_ZH.search(block)
         definition_zh = strip_tags(m.group(1)) if m else ""
 
         examples = []
@@ -121,10 +207,10 @@ def _parse_senses(html: str) -> list[SenseData]:
             if not text_plain:
                 continue
 
-            m = re.search(r'<chn>(.*?)</chn>', ex_tail, re.DOTALL)
+            m = _RE_CHN.search(ex_tail)
             text_zh = strip_tags(m.group(1)) if m else ""
 
-            ex_audio = re.findall(r'new Audio\("([^"]+)"\)', ex_tail)
+            ex_audio = _RE_AUDIO.findall(ex_tail)
             audio_gb = next((a for a in ex_audio if "_gbs_" in a or "_brs_" in a), "")
             audio_us = next((a for a in ex_audio if "_uss_" in a or "_ams_" in a), "")
 
@@ -155,16 +241,14 @@ def _parse_senses(html: str) -> list[SenseData]:
 def _parse_verb_forms(block: str) -> list[VerbFormData]:
     """Extract verb conjugation rows from <table class="verb_forms_table">."""
     forms = []
-    for form_attr, content in re.findall(
-        r'<tr\b[^>]*\bform="([^"]+)"[^>]*>(.*?)</tr>', block, re.DOTALL
-    ):
-        td = re.search(r'<td\b[^>]*\bclass="verb_form"[^>]*>(.*?)</td>', content, re.DOTALL)
+    for form_attr, content in _RE_VERB_FORM_ROW.findall(block):
+        td = _RE_VERB_FORM_TD.search(content)
         label_word = strip_tags(td.group(1)) if td else ""
 
-        m = re.search(r'class="phons_br".*?new Audio\("([^"]+)"\)', content, re.DOTALL)
+        m = _RE_VERB_FORM_AUDIO_GB.search(content)
         audio_gb = m.group(1) if m else ""
 
-        m = re.search(r'class="phons_n_am".*?new Audio\("([^"]+)"\)', content, re.DOTALL)
+        m = _RE_VERB_FORM_AUDIO_US.search(content)
         audio_us = m.group(1) if m else ""
 
         if label_word:
@@ -177,49 +261,37 @@ def _parse_verb_forms(block: str) -> list[VerbFormData]:
     return forms
 
 
-def _extract_unbox(block: str, unbox_type: str) -> list[str]:
-    """Extract all unbox sections of a given type from a block."""
-    sections = []
-    pattern = f'<span class="unbox"[^>]*unbox="{unbox_type}"[^>]*>'
-    for m in re.finditer(pattern, block):
-        start = m.start()
-        # Find matching closing by tracking span depth
-        depth, pos = 1, m.end()
-        while pos < len(block) and depth > 0:
-            open_next = block.find("<span", pos)
-            close_next = block.find("</span>", pos)
-            if close_next == -1:
-                break
-            if open_next != -1 and open_next < close_next:
-                depth += 1
-                pos = open_next + 5
-            else:
-                depth -= 1
-                if depth == 0:
-                    sections.append(block[m.end():close_next])
-                    break
-                pos = close_next + 7
+def _extract_unboxes(block: str) -> dict[str, list[str]]:
+    """Extract all unbox sections of the parsed types from a block in one pass,
+    keyed by their unbox="..." type."""
+    sections: dict[str, list[str]] = {}
+    for m in _RE_UNBOX_TYPED.finditer(block):
+        if m.group(1) not in _UNBOX_TYPES:
+            continue
+        close = _span_close(block, m.end())
+        if close != -1:
+            sections.setdefault(m.group(1), []).append(block[m.end():close])
     return sections
 
 
-def _parse_synonyms(block: str) -> list[SynonymData]:
+def _parse_synonyms(sections: list[str]) -> list[SynonymData]:
     """Parse synonym boxes (unbox="synonyms")."""
     results = []
-    for section in _extract_unbox(block, "synonyms"):
+    for section in sections:
         # Group title from <span class="closed">...</span>
-        m = re.search(r'<span class="closed">([^<]+)</span>', section)
+        m = _RE_SYN_TITLE.search(section)
         group_title = m.group(1).strip() if m else ""
 
         # Synonym words from <ul class="inline"><li class="li">WORD</li>
-        for li in re.findall(r'<ul class="inline"[^>]*>(.*?)</ul>', section, re.DOTALL):
-            for word_m in re.finditer(r'<li class="li"[^>]*>([^<]+)</li>', li):
+        for li in _RE_SYN_INLINE.findall(section):
+            for word_m in _RE_LI_WORD.finditer(li):
                 results.append(SynonymData(
                     word=word_m.group(1).strip(),
                     group_title=group_title,
                 ))
 
         # Per-word definitions from deflist
-        for li in re.findall(r'<li class="li"[^>]*>\s*<span class="dt">(.*?)</span>\s*<span class="dd">(.*?)</span>', section, re.DOTALL):
+        for li in _RE_SYN_DEF.findall(section):
             word = strip_tags(li[0]).strip()
             definition = strip_tags(li[1]).strip()
             # Update existing synonym with definition
@@ -231,16 +303,16 @@ def _parse_synonyms(block: str) -> list[SynonymData]:
     return results
 
 
-def _parse_word_origin(block: str) -> tuple[str, str]:
+def _parse_word_origin(sections: list[str]) -> tuple[str, str]:
     """Parse word origin (unbox="wordorigin"). Returns (text_plain, text_html)."""
-    for section in _extract_unbox(block, "wordorigin"):
+    for section in sections:
         # Content is in <span class="body"><span class="p">...</span></span>
-        body_m = re.search(r'<span class="body"[^>]*>(.*)', section, re.DOTALL)
+        body_m = _RE_ORIGIN_BODY.search(section)
         if not body_m:
             continue
         body = body_m.group(1)
         # Extract inner <span class="p"> content
-        p_m = re.search(r'<span class="p"[^>]*>(.*?)</span>', body, re.DOTALL)
+        p_m = _RE_P.search(body)
         if p_m:
             text_html = p_m.group(1).strip()
         else:
@@ -250,15 +322,15 @@ def _parse_word_origin(block: str) -> tuple[str, str]:
     return "", ""
 
 
-def _parse_word_family(block: str) -> list[WordFamilyData]:
+def _parse_word_family(sections: list[str]) -> list[WordFamilyData]:
     """Parse word family (unbox="wordfamily")."""
     results = []
-    for section in _extract_unbox(block, "wordfamily"):
-        for li in re.finditer(r'<span class="p"[^>]*>(.*?)</span>\s*</li>', section, re.DOTALL):
+    for section in sections:
+        for li in _RE_FAMILY_ITEM.finditer(section):
             content = li.group(1)
-            wfw = re.search(r'<span class="wfw"[^>]*>([^<]+)</span>', content)
-            wfp = re.search(r'<span class="wfp"[^>]*>([^<]+)</span>', content)
-            wfo = re.search(r'<span class="wfo"[^>]*>([^<]+)</span>', content)
+            wfw = _RE_FAMILY_WORD.search(content)
+            wfp = _RE_FAMILY_POS.search(content)
+            wfo = _RE_FAMILY_OPP.search(content)
             if wfw:
                 results.append(WordFamilyData(
                     word=wfw.group(1).strip(),
@@ -268,16 +340,16 @@ def _parse_word_family(block: str) -> list[WordFamilyData]:
     return results
 
 
-def _parse_collocations(block: str) -> list[CollocationData]:
+def _parse_collocations(sections: list[str]) -> list[CollocationData]:
     """Parse Oxford Collocations Dictionary snippets (unbox="snippet")."""
     results = []
-    for section in _extract_unbox(block, "snippet"):
+    for section in sections:
         # Split by inner <span class="unbox"> category headers
         # Skip the first "Oxford Collocations Dictionary" title
-        parts = re.split(r'<span class="unbox"[^>]*>', section)
+        parts = _RE_UNBOX_OPEN.split(section)
         for part in parts:
             # Category name is the text before the first tag
-            cat_m = re.match(r'([^<]+)<', part)
+            cat_m = _RE_COLLOC_CATEGORY.match(part)
             if not cat_m:
                 continue
             category = cat_m.group(1).strip()
@@ -285,7 +357,7 @@ def _parse_collocations(block: str) -> list[CollocationData]:
                 continue
             # Words from <ul class="collocs_list"><li>
             words = []
-            for li_m in re.finditer(r'<li class="li"[^>]*>([^<]+)</li>', part):
+            for li_m in _RE_LI_WORD.finditer(part):
                 w = li_m.group(1).strip()
                 if w and w != "…":
                     words.append(w)
@@ -297,52 +369,40 @@ def _parse_collocations(block: str) -> list[CollocationData]:
 def _parse_xrefs(block: str) -> list[XrefData]:
     """Parse cross-references (see also, compare) using depth-aware span parsing."""
     results = []
-    for m in re.finditer(r'<span class="xrefs"[^>]*>', block):
+    for m in _RE_XREFS_OPEN.finditer(block):
         # Extract xt attribute from the opening tag
-        xt_m = re.search(r'xt="(\w+)"', m.group(0))
+        xt_m = _RE_XREF_TYPE.search(m.group(0))
         if not xt_m:
             continue
         xref_type = xt_m.group(1)
 
         # Depth-aware extraction of inner content
-        depth, pos = 1, m.end()
-        while pos < len(block) and depth > 0:
-            open_next = block.find("<span", pos)
-            close_next = block.find("</span>", pos)
-            if close_next == -1:
-                break
-            if open_next != -1 and open_next < close_next:
-                depth += 1
-                pos = open_next + 5
-            else:
-                depth -= 1
-                if depth == 0:
-                    content = block[m.end():close_next]
-                    for xh in re.finditer(r'<span class="xh"[^>]*>([^<]+)</span>', content):
-                        results.append(XrefData(xref_type=xref_type, target_word=xh.group(1).strip()))
-                    break
-                pos = close_next + 7
+        close = _span_close(block, m.end())
+        if close == -1:
+            continue
+        for xh in _RE_XH.finditer(block, m.end(), close):
+            results.append(XrefData(xref_type=xref_type, target_word=xh.group(1).strip()))
     return results
 
 
 def _parse_phrasal_verbs(block: str) -> list[str]:
     """Parse phrasal verb links from <aside class="phrasal_verb_links">."""
     results = []
-    m = re.search(r'<aside class="phrasal_verb_links"[^>]*>(.*?)</aside>', block, re.DOTALL)
+    m = _RE_PHRASAL_VERBS.search(block)
     if m:
-        for xh in re.finditer(r'<span class="xh"[^>]*>([^<]+)</span>', m.group(1)):
+        for xh in _RE_XH.finditer(m.group(1)):
             results.append(xh.group(1).strip())
     return results
 
 
-def _parse_extra_examples(block: str) -> list[ExtraExampleData]:
+def _parse_extra_examples(sections: list[str]) -> list[ExtraExampleData]:
     """Parse extra examples (unbox="extra_examples")."""
     results = []
-    for section in _extract_unbox(block, "extra_examples"):
-        for li in re.finditer(r'<li[^>]*>(.*?)</li>', section, re.DOTALL):
+    for section in sections:
+        for li in _RE_EXTRA_ITEM.finditer(section):
             content = li.group(1)
             # Text from <span class="unx">
-            unx = re.search(r'<span class="unx"[^>]*>(.*?)</span>', content, re.DOTALL)
+            unx = _RE_EXTRA_TEXT.search(content)
             if not unx:
                 continue
             text_html = unx.group(1).strip()
@@ -350,7 +410,7 @@ def _parse_extra_examples(block: str) -> list[ExtraExampleData]:
             if not text_plain:
                 continue
             # Chinese from <chn>
-            chn = re.search(r'<chn>(.*?)</chn>', content, re.DOTALL)
+            chn = _RE_CHN.search(content)
             text_zh = strip_tags(chn.group(1)) if chn else ""
             results.append(ExtraExampleData(
                 text_plain=text_plain,
@@ -362,43 +422,45 @@ def _parse_extra_examples(block: str) -> list[ExtraExampleData]:
 
 def _parse_pos_block(block: str, fallback_headword: str) -> EntryData | None:
     """Parse one <div class="entry"> block."""
-    m = re.search(r'<h1\s[^>]*class="headword"[^>]*>([^<]+)</h1>', block)
-    headword = m.group(1).strip() if m else fallback_headword
+    m = _RE_HEADWORD.search(block)
+    if m and m.group(2) is None:
+        # First <h1> has nested markup; look for a later plain-text one
+        text_m = _RE_HEADWORD_TEXT.search(block)
+        headword = text_m.group(1).strip() if text_m else fallback_headword
+    else:
+        headword = m.group(2).strip() if m else fallback_headword
 
     # Oxford levels from headword <h1> attributes
-    h1_tag = re.search(r'<h1\s[^>]*class="headword"[^>]*>', block)
-    h1_attrs = h1_tag.group(0) if h1_tag else ""
+    h1_attrs = m.group(1) if m else ""
     ox3000 = 'ox3000="y"' in h1_attrs
     ox5000 = 'ox5000="y"' in h1_attrs
 
-    m = re.search(r'<span class="pos"[^>]*>([^<]+)</span>', block)
+    m = _RE_POS.search(block)
     pos = m.group(1).strip() if m else ""
 
-    m = re.search(r'class="phons_br"[^>]*>.*?<span class="phon">([^<]+)</span>', block, re.DOTALL)
+    m = _RE_PHON_GB.search(block)
     ipa_gb = m.group(1).strip() if m else ""
 
-    m = re.search(r'class="phons_n_am"[^>]*>.*?<span class="phon">([^<]+)</span>', block, re.DOTALL)
+    m = _RE_PHON_US.search(block)
     ipa_us = m.group(1).strip() if m else ""
 
     # Entry-level CEFR from symbols div
-    m = re.search(r'<div class="symbols"[^>]*>.*?</div>', block, re.DOTALL)
+    m = _RE_SYMBOLS.search(block)
     cefr_level = ""
     if m:
-        cefr_m = re.search(r'data-cefr="(\w+)"', m.group(0))
+        cefr_m = _RE_DATA_CEFR.search(m.group(0))
         if not cefr_m:
             # Fallback: try to find cefr from first sense
-            cefr_m = re.search(r'cefr="(\w+)"', block)
+            cefr_m = _RE_CEFR.search(block)
         if cefr_m:
             cefr_level = cefr_m.group(1)
 
-    sense_start = min(
-        (block.find(t) for t in ('<ol class="sense', '<li class="sense') if block.find(t) != -1),
-        default=2000,
-    )
+    m = _RE_SENSE_START.search(block)
+    sense_start = m.start() if m else 2000
     phon_section = block[:sense_start]
-    all_audio = re.findall(r'new Audio\("([^"]+)"\)', phon_section)
-    audio_gb = next((a for a in all_audio if re.match(r"[^_].*_gb_", a)), "")
-    audio_us = next((a for a in all_audio if re.match(r"[^_].*_us_", a)), "")
+    all_audio = _RE_AUDIO.findall(phon_section)
+    audio_gb = next((a for a in all_audio if _RE_AUDIO_GB.match(a)), "")
+    audio_us = next((a for a in all_audio if _RE_AUDIO_US.match(a)), "")
 
     groups = []
     # Track xrefs found at sense/group level to deduplicate entry-level
@@ -416,10 +478,8 @@ def _parse_pos_block(block: str, fallback_headword: str) -> EntryData | None:
         return group_xrefs
 
     # Senses before any shcut-g / idm-g section
-    first_section = min(
-        (block.find(t) for t in ('<span class="shcut-g"', '<span class="idm-g"') if block.find(t) != -1),
-        default=len(block),
-    )
+    m = _RE_SECTION_START.search(block)
+    first_section = m.start() if m else len(block)
     pre_fragment = block[:first_section]
     pre_senses = _parse_senses(pre_fragment)
     if pre_senses:
@@ -427,16 +487,13 @@ def _parse_pos_block(block: str, fallback_headword: str) -> EntryData | None:
         groups.append(SenseGroupData(senses=pre_senses, xrefs=pre_xrefs))
 
     # Senses grouped under topic headers (shcut-g)
-    for shcut in re.findall(
-        r'<span class="shcut-g".*?(?=<span class="shcut-g"|<span class="idm-g"|$)',
-        block, re.DOTALL,
-    ):
+    for shcut in _RE_SHCUT_GROUP.findall(block):
         topic_en, topic_zh = "", ""
-        h2 = re.search(r'<h2 class="shcut"[^>]*>(.*?)</h2>', shcut, re.DOTALL)
+        h2 = _RE_SHCUT_TITLE.search(shcut)
         if h2:
             raw = h2.group(1)
-            topic_en = strip_tags(re.sub(r'<shcutt>.*?</shcutt>', '', raw, flags=re.DOTALL))
-            chn = re.search(r'<chn>(.*?)</chn>', raw, re.DOTALL)
+            topic_en = strip_tags(_RE_SHCUTT.sub('', raw))
+            chn = _RE_CHN.search(raw)
             topic_zh = chn.group(1).strip() if chn else ""
         senses = _parse_senses(shcut)
         if senses:
@@ -453,12 +510,13 @@ def _parse_pos_block(block: str, fallback_headword: str) -> EntryData | None:
     entry_xrefs = [x for x in all_xrefs if (x.xref_type, x.target_word) not in claimed_xrefs]
 
     # New fields
-    synonyms = _parse_synonyms(block)
-    word_origin_plain, word_origin_html = _parse_word_origin(block)
-    word_family = _parse_word_family(block)
-    collocations = _parse_collocations(block)
+    unboxes = _extract_unboxes(block)
+    synonyms = _parse_synonyms(unboxes.get("synonyms", []))
+    word_origin_plain, word_origin_html = _parse_word_origin(unboxes.get("wordorigin", []))
+    word_family = _parse_word_family(unboxes.get("wordfamily", []))
+    collocations = _parse_collocations(unboxes.get("snippet", []))
     phrasal_verbs = _parse_phrasal_verbs(block)
-    extra_examples = _parse_extra_examples(block)
+    extra_examples = _parse_extra_examples(unboxes.get("extra_examples", []))
 
     return EntryData(
         headword=headword,
@@ -487,11 +545,8 @@ def _parse_pos_block(block: str, fallback_headword: str) -> EntryData | None:
 def _parse_idioms(block: str) -> list[tuple[EntryData, str]]:
     """One (EntryData, idiom_html) per idiom found in a PoS block."""
     idioms = []
-    for idm in re.findall(
-        r'<span class="idm-g".*?(?=<span class="idm-g"|$)',
-        block, re.DOTALL,
-    ):
-        m = re.search(r'<span class="idm"[^>]*>(.*?)</span>', idm)
+    for idm in _RE_IDIOM_GROUP.findall(block):
+        m = _RE_IDIOM.search(idm)
         phrase = strip_tags(m.group(1)) if m else ""
         if not phrase:
             continue
@@ -512,11 +567,15 @@ def _parse_idioms(block: str) -> list[tuple[EntryData, str]]:
 
 def parse_entry(html: str) -> list[tuple[EntryData, str]]:
     """Return (EntryData, raw_html) per PoS block + per idiom."""
-    m = re.search(r'd:title="([^"]+)"', html)
+    m = _RE_TITLE.search(html)
     fallback = m.group(1) if m else ""
 
+    # Literal split, re-attaching the delimiter to each PoS block
+    head, *rest = html.split(_ENTRY_OPEN)
+    blocks = [head] + [_ENTRY_OPEN + b for b in rest]
+
     results: list[tuple[EntryData, str]] = []
-    for block in re.split(r'(?=<div class="entry")', html):
+    for block in blocks:
         if 'class="entry"' not in block:
             continue
         parsed = _parse_pos_block(block, fallback)
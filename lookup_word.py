@@ -12,76 +12,118 @@ Output: opens the entry as an HTML file in your default browser.
          Pass --html to print the HTML to stdout instead.
 """
 
-import json
+import array
+import bisect
+import mmap
 import re
-import struct
 import sys
-import zlib
 import tempfile
 import webbrowser
+from itertools import islice
 from pathlib import Path
 
-CONTENTS = Path("oxford.dictionary/Contents").resolve()
-BODY = CONTENTS / "Body.data"
-INDEX_CACHE = Path(".oald10_index.json")
+from db.body import CONTENTS, inflate_entry_at, map_body
+from db.body import build_index as scan_index
 
+INDEX_KEYS = Path(".oald10_index.keys.txt")
+INDEX_OFFSETS = Path(".oald10_index.offsets.bin")
 
-# ── Index ─────────────────────────────────────────────────────────────────────
 
-def build_index() -> dict:
+# ── Index ─────────────────────────────────────────────────────────────────────
+# Cached as two parallel files: sorted lowercased headwords (one per line) and
+# their Body.data offsets as native uint64. Lookups bisect the mmapped keys, so
+# startup never materializes a dict of every headword.
+
+class HeadwordIndex:
+    """Read-only headword -> Body.data offset mapping over the index cache."""
+
+    def __init__(self, keys_path: Path, offsets_path: Path):
+        with open(keys_path, "rb") as f:
+            self._keys = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._offsets = array.array("Q", offsets_path.read_bytes())
+
+        # Start of each line, plus one past the final newline
+        self._starts = array.array("Q", [0])
+        pos = self._keys.find(b"\n")
+        while pos != -1:
+            self._starts.append(pos + 1)
+            pos = self._keys.find(b"\n", pos + 1)
+
+    def _key_at(self, i: int) -> bytes:
+        return self._keys[self._starts[i] : self._starts[i + 1] - 1]
+
+    def _find(self, key: str) -> int:
+        # UTF-8 byte order matches code point order, so bytes bisect like str
+        target = key.encode("utf-8")
+        i = bisect.bisect_left(range(len(self)), target, key=self._key_at)
+        return i if i < len(self) and self._key_at(i) == target else -1
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def __contains__(self, key: str) -> bool:
+        return self._find(key) != -1
+
+    def __getitem__(self, key: str) -> int:
+        i = self._find(key)
+        if i == -1:
+            raise KeyError(key)
+        return self._offsets[i]
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self._key_at(i).decode("utf-8")
+
+    def keys_with_prefix(self, prefix: str):
+        """Headwords starting with prefix, in sorted order, starting from a bisect."""
+        target = prefix.encode("utf-8")
+        i = bisect.bisect_left(range(len(self)), target, key=self._key_at)
+        while i < len(self):
+            key = self._key_at(i)
+            if not key.startswith(target):
+                return
+            yield key.decode("utf-8")
+            i += 1
+
+
+def build_index() -> HeadwordIndex:
     print("Building index (one-time, ~10s)…", file=sys.stderr)
-    index = {}
-
-    with open(BODY, "rb") as f:
-        data = f.read()
+    with map_body() as data:
+        index = scan_index(data)
 
-    pos = 0x60
-    while pos < len(data) - 12:
-        sz1 = struct.unpack_from("<I", data, pos)[0]
-        sz2 = struct.unpack_from("<I", data, pos + 4)[0]
-        if sz1 == 0 or sz1 > 500_000:
-            break
+    keys = sorted(index)
+    INDEX_KEYS.write_text("".join(f"{k}\n" for k in keys), encoding="utf-8")
+    INDEX_OFFSETS.write_bytes(array.array("Q", (index[k] for k in keys)).tobytes())
+    print(f"Index built: {len(index)} entries.", file=sys.stderr)
+    return HeadwordIndex(INDEX_KEYS, INDEX_OFFSETS)
 
-        zlib_start = pos + 12
-        compressed_size = sz2 - 4
 
-        try:
-            partial = zlib.decompress(data[zlib_start : zlib_start + compressed_size], 15, 512)
-            m = re.search(rb'd:title="([^"]+)"', partial)
-            if m:
-                title = m.group(1).decode("utf-8", errors="replace")
-                index[title.lower()] = pos
-        except Exception:
-            pass
+def load_index() -> HeadwordIndex:
+    if INDEX_KEYS.exists() and INDEX_OFFSETS.exists():
+        return HeadwordIndex(INDEX_KEYS, INDEX_OFFSETS)
+    return build_index()
 
-        pos = zlib_start + compressed_size
 
-    INDEX_CACHE.write_text(json.dumps(index, ensure_ascii=False))
-    print(f"Index built: {len(index)} entries.", file=sys.stderr)
-    return index
+# ── Entry HTML ────────────────────────────────────────────────────────────────
 
+_BODY_MM = None
 
-def load_index() -> dict:
-    if INDEX_CACHE.exists():
-        return json.loads(INDEX_CACHE.read_text())
-    return build_index()
 
+def _read_body_entry(pos: int) -> bytes:
+    # Map Body.data once and inflate entries out of it, instead of an
+    # open/seek/read/close round-trip per entry.
+    global _BODY_MM
+    if _BODY_MM is None:
+        _BODY_MM = map_body()
+    return inflate_entry_at(_BODY_MM, pos)
 
-# ── Entry HTML ────────────────────────────────────────────────────────────────
 
-def get_entry_html(index: dict, word: str) -> str | None:
+def get_entry_html(index: HeadwordIndex, word: str) -> str | None:
     key = word.lower().strip()
     if key not in index:
         return None
 
-    pos = index[key]
-    with open(BODY, "rb") as f:
-        f.seek(pos)
-        header = f.read(12)
-        sz2 = struct.unpack_from("<I", header, 4)[0]
-        compressed = f.read(sz2 - 4)
-
-    return zlib.decompress(compressed).decode("utf-8", errors="replace")
+    return _read_body_entry(index[key]).decode("utf-8", errors="replace")
 
 
 # ── Render ────────────────────────────────────────────────────────────────────
@@ -139,7 +181,7 @@ def main():
 
     if entry_html is None:
         lower = word.lower()
-        matches = [k for k in index if k.startswith(lower)][:8]
+        matches = list(islice(index.keys_with_prefix(lower), 8))
         if matches:
             print(f'"{word}" not found. Did you mean: {", ".join(matches)}?')
         else:
@@ -9,14 +9,13 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-from db.importer import _build_index, _read_entry_at, BODY
+from db.body import build_index, map_body, read_entry_at
 from db.models import EntryData
 from db.parser import parse_entry
 
 
-def _collect_audio(entry: EntryData) -> set[str]:
-    """Collect all audio filenames referenced by an entry."""
-    files = set()
+def _collect_audio(entry: EntryData, files: set[str]) -> None:
+    """Add all audio filenames referenced by an entry to files."""
     if entry.audio_gb:
         files.add(entry.audio_gb)
     if entry.audio_us:
@@ -33,7 +32,6 @@ def _collect_audio(entry: EntryData) -> set[str]:
                     files.add(ex.audio_gb)
                 if ex.audio_us:
                     files.add(ex.audio_us)
-    return files
 
 EXPORT_DIR = Path("export")
 HTML_DIR = EXPORT_DIR / "html"
@@ -49,11 +47,11 @@ def sanitize_filename(text: str) -> str:
 def main():
     HTML_DIR.mkdir(parents=True, exist_ok=True)
 
-    print("Loading Body.data...", file=sys.stderr)
-    body_data = BODY.read_bytes()
+    print("Mapping Body.data...", file=sys.stderr)
+    body_data = map_body()
 
     print("Building word index...", file=sys.stderr)
-    index = _build_index(body_data)
+    index = build_index(body_data)
     print(f"  {len(index)} headwords found", file=sys.stderr)
 
     print("Exporting HTML files...", file=sys.stderr)
@@ -62,12 +60,12 @@ def main():
     total_entries = 0
     failed = []
 
-    for i, title in enumerate(sorted(index.keys())):
+    for i, title in enumerate(sorted(index)):
         if i % 1000 == 0 and i > 0:
             print(f"  {i}/{len(index)} headwords processed...", file=sys.stderr)
 
         try:
-            html = _read_entry_at(body_data, index[title])
+            html = read_entry_at(body_data, index[title])
             entries = parse_entry(html)
 
             for entry_index, (entry, raw_html) in enumerate(entries):
@@ -85,12 +83,14 @@ def main():
                 used_filenames.add(filename)
                 (HTML_DIR / filename).write_text(raw_html, encoding="utf-8")
 
-                all_audio_files |= _collect_audio(entry)
+                _collect_audio(entry, all_audio_files)
                 total_entries += 1
 
         except Exception as e:
             failed.append((title, str(e)))
 
+    body_data.close()
+
     # Write audio filelist (one filename per line, for rclone --files-from)
     audio_list = sorted(all_audio_files)
     (EXPORT_DIR / "audio_filelist.txt").write_text(
@@ -128,6 +128,8 @@ def build_audio_packs(audio_list: list[str]):
         pack_name = f"pack-{i:03d}.tar"
         pack_path = PACKS_DIR / pack_name
 
+        # Plain (uncompressed) tar on purpose: mp3 is already compressed, so
+        # gzip/deflate would burn CPU on every pack for ~0% size gain.
         with tarfile.open(pack_path, "w") as tar:
             for filename in chunk:
                 tar.add(AUDIO_SOURCE / filename, arcname=filename)